@@ -1,4 +1,8 @@
 from .solve import solve, _MANIFOLDS, _METHODS
+from .timestepper import state_independent
+from .tune import tune
+from .benchmark import work_precision
+from . import reducers
 
 
 def manifolds():
@@ -14,6 +18,8 @@ def methods():
     temp_manifold.exp = None
     temp_manifold.dexpinv = None
     temp_manifold.action = None
+    temp_manifold.commutator = None
+    temp_manifold.vector = None
     for key, method in _METHODS.items():
         method_instance = method(temp_manifold)
         output_string = f'"{key}":\t'
@@ -26,4 +32,12 @@ def methods():
         print(output_string)
 
 
-__all__ = ["solve", "manifolds", "methods"]
+__all__ = [
+    "solve",
+    "tune",
+    "work_precision",
+    "state_independent",
+    "reducers",
+    "manifolds",
+    "methods",
+]
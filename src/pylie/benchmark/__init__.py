@@ -0,0 +1,3 @@
+from .benchmark import work_precision, WorkPrecision
+
+__all__ = ["work_precision", "WorkPrecision"]
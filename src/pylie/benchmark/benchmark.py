@@ -0,0 +1,134 @@
+import time
+import numpy as np
+from collections.abc import Iterable
+from typing import Callable
+
+from ..solve import solve, _MANIFOLDS, _METHODS, _default_methods
+
+
+class _CountedFunction:
+    """Wraps f and counts the number of times it is evaluated."""
+
+    def __init__(self, f):
+        self.f = f
+        self.calls = 0
+        self.state_independent = getattr(f, "state_independent", False)
+
+    def __call__(self, t, y):
+        self.calls += 1
+        return self.f(t, y)
+
+
+class WorkPrecision:
+    """Object which holds the work-precision data computed by
+    `pylie.work_precision`. All dictionaries are keyed by method name,
+    and their arrays are ordered like `h`.
+
+    Attributes
+    ----------
+    h : array
+        Step lengths used
+    error : dict
+        Distance on the manifold between the solution at t_end and
+        the reference solution. NaN for runs which failed
+    time : dict
+        Wall time in seconds of each run. NaN for runs which failed
+    f_evals : dict
+        Number of evaluations of f in each run, up to the failure
+        for runs which failed
+    order : dict
+        Observed order of convergence, the least squares slope of
+        log(error) against log(h) over the successful runs
+    """
+
+    def __init__(self, h, error, time, f_evals, order):
+        self.h = h
+        self.error = error
+        self.time = time
+        self.f_evals = f_evals
+        self.order = order
+
+
+def _observed_order(h, error):
+    mask = np.isfinite(error) & (error > 0)
+    if np.count_nonzero(mask) < 2:
+        return np.nan
+    slope, _ = np.polyfit(np.log(h[mask]), np.log(error[mask]), 1)
+    return slope
+
+
+def work_precision(
+    f: Callable[[float, Iterable], Iterable],
+    y,
+    t_start,
+    t_end,
+    manifold: str,
+    step_lengths,
+    methods=None,
+    reference=None,
+):
+    """Solve the ODE defined by `f` with every method and every step
+    length in `step_lengths`, and measure the error at t_end together
+    with the work spent.
+
+    Parameters
+    ----------
+    f : Callable[[float, Iterable], Iterable]
+        Function defining the differential equation.
+        Must have call signature `f(t, y)`.
+    y : Iterable
+        Initial value
+    t_start : number
+        Initial time
+    t_end : number
+        End time
+    manifold : str
+        Manifold on which the ODE evolves. Use `pylie.manifolds()`
+        to print a list.
+    step_lengths : Iterable
+        Step lengths to use
+    methods : Iterable of str, optional
+        Methods to compare. Defaults to every method in `pylie.methods()`
+        applicable to `f`.
+    reference : Iterable, optional
+        The exact solution at t_end. If not given, a reference solution is
+        computed with the highest order method available, using a step
+        length a tenth of the shortest in `step_lengths`.
+
+    Returns
+    -------
+    WorkPrecision
+        Object with attributes h, error, time, f_evals and order.
+    """
+    if methods is None:
+        methods = _default_methods(f)
+    h = np.sort(np.asarray(step_lengths, dtype=float))[::-1]
+    hmanifold = _MANIFOLDS[manifold](y)
+    if reference is None:
+        reference_method = "M6" if getattr(f, "state_independent", False) else "RKMK4"
+        reference = solve(f, y, t_start, t_end, h[-1] / 10, manifold, reference_method)
+        reference = reference[:, -1]
+
+    error, elapsed, f_evals, order = {}, {}, {}, {}
+    for method in methods:
+        error[method] = np.zeros(len(h))
+        elapsed[method] = np.zeros(len(h))
+        f_evals[method] = np.zeros(len(h), dtype=int)
+        for i, step_length in enumerate(h):
+            counted_f = _CountedFunction(f)
+            start = time.perf_counter()
+            try:
+                flow = solve(
+                    counted_f, y, t_start, t_end, step_length, manifold, method
+                )
+            except Exception:
+                # E.g. the Newton iteration of an implicit method did not
+                # converge, or the solution left the manifold
+                elapsed[method][i] = np.nan
+                error[method][i] = np.nan
+            else:
+                elapsed[method][i] = time.perf_counter() - start
+                error[method][i] = hmanifold.dist(flow[:, -1], reference)
+            f_evals[method][i] = counted_f.calls
+        order[method] = _observed_order(h, error[method])
+    return WorkPrecision(h, error, elapsed, f_evals, order)
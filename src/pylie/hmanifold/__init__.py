@@ -1,6 +1,12 @@
-from .hmanifold import HomogenousManifold
+from .hmanifold import HomogenousManifold, ExpCache
 from .hmnsphere import HomogenousSphere
 from .hmheavytop import HeavyTop
 from .hmpendulum import SphericalPendulum
 
-__all__ = ["HomogenousManifold", "HomogenousSphere", "HeavyTop", "SphericalPendulum"]
+__all__ = [
+    "HomogenousManifold",
+    "ExpCache",
+    "HomogenousSphere",
+    "HeavyTop",
+    "SphericalPendulum",
+]
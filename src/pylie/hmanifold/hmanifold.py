@@ -1,3 +1,50 @@
+import numpy as np
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class ExpCache:
+    """Memoizes the exponential map of a Lie algebra, with least recently
+    used eviction once `maxsize` entries are stored.
+
+    The key is the argument passed to exp, i.e. the algebra element
+    already scaled by the step length h.
+    """
+
+    def __init__(self, exp, maxsize=128):
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+        self._exp = exp
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+
+    def __call__(self, y):
+        key = (y.shape, y.tobytes())
+        try:
+            value = self._cache[key]
+        except KeyError:
+            self.misses += 1
+            value = self._exp(y)
+            self._cache[key] = value
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+            return value
+        self.hits += 1
+        self._cache.move_to_end(key)
+        return value
+
+    def cache_info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._cache))
+
+    def cache_clear(self):
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+
 class HomogenousManifold:
     """A homogenous manifold is a manifold acted upon by a Lie group action.
 
@@ -8,10 +55,19 @@ class HomogenousManifold:
         self.exp = self.lie_algebra.exp
         self.dexpinv = self.lie_algebra.dexpinv
         self.action = self.lie_group.action
+        self.commutator = self.lie_algebra.commutator
+        self.vector = self.lie_algebra.vector
+
+    def cache_exp(self, maxsize=128):
+        """Replace exp by a memoized version. Must be called before the
+        manifold is passed to a time stepper. Returns the ExpCache."""
+        self.exp = ExpCache(self.lie_algebra.exp, maxsize)
+        return self.exp
 
     def dist(self, a, b):
-        # TODO
-        pass
+        """Distance between the points a and b, measured in the
+        coordinates of the space the manifold is embedded in."""
+        return np.linalg.norm(np.asarray(a) - np.asarray(b))
 
     def origin(self):
         # TODO
@@ -19,6 +19,13 @@ class HomogenousSphere(HomogenousManifold):
         self.lie_algebra = soLieAlgebra(self.lie_group)
         super().__init__()
 
+    def dist(self, a, b):
+        """Great-circle distance between the points a and b on the sphere."""
+        # Computed from the chord length, which unlike arccos of the inner
+        # product is accurate for nearby points
+        chord = np.linalg.norm(np.asarray(a) - np.asarray(b))
+        return 2 * np.arcsin(min(chord / 2, 1.0))
+
     @property
     def y(self):
         return self._y
@@ -28,17 +28,20 @@ class LieAlgebra:
         else:
             raise NotImplementedError
 
+    def vector(self, y):
+        """Returns the representation of y used by exp and dexpinv."""
+        return y
+
 
 class soLieAlgebra(LieAlgebra):
     def exp(self, y):
         if y.size == 3 and y.ndim == 1:
             # Use the rodrigues formula
 
-            # Check if y is the zero vector
-            if np.array_equal(y, np.zeros(3)):
-                return np.eye(3)
-
             alpha = np.linalg.norm(y)
+            # Check if y is the zero vector, or so small that alpha underflows
+            if alpha == 0:
+                return np.eye(3)
             Y = self.matrix(y)
             return (
                 np.eye(3)
@@ -49,20 +52,32 @@ class soLieAlgebra(LieAlgebra):
         # We are here assuming that y is a matrix
         return super().exp(y)
 
+    def commutator(self, a, b):
+        if a.size == 3 and a.ndim == 1 and b.size == 3 and b.ndim == 1:
+            # The commutator of hat-matrices is the hat of the cross product
+            return np.cross(a, b)
+        return super().commutator(a, b)
+
+    def vector(self, y):
+        if y.shape == (3, 3):
+            return np.array([y[2, 1], y[0, 2], y[1, 0]])
+        return y
+
     def dexpinv(self, u, v, _):
         if u.size == 3 and u.ndim == 1:
             # Use Rodrigues formula
             v_vector = np.array([v[2, 1], v[0, 2], v[1, 0]])
             alpha = np.linalg.norm(u)
             # Check for the zero vector
-            if np.isclose(alpha, 0):
+            if alpha == 0:
                 return v_vector
+            if alpha < 1e-3:
+                # Taylor expansion, the closed form suffers from cancellation
+                coefficient = 1 / 12 + alpha ** 2 / 720
+            else:
+                coefficient = (2 - alpha / np.tan(0.5 * alpha)) / (2 * alpha ** 2)
             u_hat = self.matrix(u)
-            lhs = (
-                np.eye(3)
-                - 0.5 * u_hat
-                + (2 - alpha / np.tan(0.5 * alpha)) / (2 * alpha ** 2) * u_hat @ u_hat
-            )
+            lhs = np.eye(3) - 0.5 * u_hat + coefficient * u_hat @ u_hat
             return self.action(lhs, v_vector)
         else:
             return super().dexpinv(u, v)
@@ -102,6 +117,13 @@ class seLieAlgebra(LieAlgebra):
             ) @ v
         return (u_exp, v_exp)
 
+    def commutator(self, a, b):
+        """Returns the commutator [a, b] of two elements of se(3),
+        represented as vectors of length 6"""
+        A, a = np.split(a, 2)
+        B, b = np.split(b, 2)
+        return np.hstack((np.cross(A, B), np.cross(A, b) - np.cross(B, a)))
+
     def _cot(self, x):
         return 1 / np.tan(x)
 
@@ -155,6 +177,15 @@ class se_nLieAlgebra(seLieAlgebra):
             ans.append(super().exp(y[6 * i : 6 * i + 6]))
         return ans
 
+    def commutator(self, a, b):
+        N = len(a) // 6
+        ans = np.zeros(len(a))
+        for i in range(N):
+            ans[6 * i : 6 * i + 6] = super().commutator(
+                a[6 * i : 6 * i + 6], b[6 * i : 6 * i + 6]
+            )
+        return ans
+
     def dexpinv(self, u, v, _=None):
         N = len(u) // 6
         ans = np.zeros(len(u))
@@ -0,0 +1,3 @@
+from .reducers import Reducer, Minimum, Maximum, TimeAverage, Final
+
+__all__ = ["Reducer", "Minimum", "Maximum", "TimeAverage", "Final"]
@@ -0,0 +1,119 @@
+import numpy as np
+
+
+class Reducer:
+    """Base class for quantities computed on the fly by `pylie.solve`.
+
+    A reducer is updated with consecutive chunks of the solution, and must
+    not keep references to them. If `observable` is given, it is applied
+    to each chunk before the reduction. It receives the chunk Y, where
+    column Y[:, i] is the solution at T[i], and must return an array whose
+    last axis corresponds to T, e.g.
+    ```
+    lambda Y: np.linalg.norm(Y[3:], axis=0)
+    ```
+    """
+
+    def __init__(self, observable=None):
+        self.observable = observable
+
+    def values(self, Y):
+        if self.observable is None:
+            return Y
+        return np.asarray(self.observable(Y))
+
+    def update(self, T, Y):
+        raise NotImplementedError
+
+    def result(self):
+        raise NotImplementedError
+
+
+class Minimum(Reducer):
+    """Running minimum of the observable over time."""
+
+    def __init__(self, observable=None):
+        super().__init__(observable)
+        self._minimum = None
+
+    def update(self, T, Y):
+        if len(T) == 0:
+            return
+        minimum = self.values(Y).min(axis=-1)
+        if self._minimum is not None:
+            minimum = np.minimum(self._minimum, minimum)
+        self._minimum = minimum
+
+    def result(self):
+        return self._minimum
+
+
+class Maximum(Reducer):
+    """Running maximum of the observable over time."""
+
+    def __init__(self, observable=None):
+        super().__init__(observable)
+        self._maximum = None
+
+    def update(self, T, Y):
+        if len(T) == 0:
+            return
+        maximum = self.values(Y).max(axis=-1)
+        if self._maximum is not None:
+            maximum = np.maximum(self._maximum, maximum)
+        self._maximum = maximum
+
+    def result(self):
+        return self._maximum
+
+
+class TimeAverage(Reducer):
+    """Time average of the observable, integrated by the trapezoidal rule."""
+
+    def __init__(self, observable=None):
+        super().__init__(observable)
+        self._integral = 0
+        self._t_start = None
+        self._last = None
+
+    def update(self, T, Y):
+        if len(T) == 0:
+            return
+        T = np.asarray(T, dtype=float)
+        values = self.values(Y)
+        if self._last is None:
+            self._t_start = T[0]
+        else:
+            # Include the interval between the previous chunk and this one
+            t_last, value_last = self._last
+            T = np.hstack((t_last, T))
+            values = np.concatenate((value_last[..., None], values), axis=-1)
+        dT = np.diff(T)
+        self._integral = self._integral + np.sum(
+            0.5 * dT * (values[..., 1:] + values[..., :-1]), axis=-1
+        )
+        self._last = (T[-1], values[..., -1].copy())
+
+    def result(self):
+        if self._last is None:
+            return None
+        duration = self._last[0] - self._t_start
+        if duration == 0:
+            return self._last[1]
+        return self._integral / duration
+
+
+class Final(Reducer):
+    """Value of the observable at the end time."""
+
+    def __init__(self, observable=None):
+        super().__init__(observable)
+        self._final = None
+
+    def update(self, T, Y):
+        if len(T) == 0:
+            return
+        self._final = self.values(Y)[..., -1].copy()
+
+    def result(self):
+        return self._final
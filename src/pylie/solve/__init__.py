@@ -1,3 +1,3 @@
-from .solve import solve, _MANIFOLDS, _METHODS
+from .solve import solve, _MANIFOLDS, _METHODS, _default_methods
 
 __all__ = ["solve"]
@@ -3,7 +3,18 @@ from collections.abc import Iterable
 from typing import Callable
 
 from ..hmanifold import HomogenousSphere, HeavyTop, SphericalPendulum
-from ..timestepper import EulerLie, ImprovedEulerLie, SSPRKMK3, RKMK4
+from ..timestepper import (
+    EulerLie,
+    ImprovedEulerLie,
+    SSPRKMK3,
+    RKMK4,
+    Magnus4,
+    Magnus6,
+    ImplicitEulerLie,
+    SDIRKMK2,
+    SDIRKMK3,
+    MagnusIntegrator,
+)
 
 _MANIFOLDS = {
     "hmnsphere": HomogenousSphere,
@@ -15,9 +26,25 @@ _METHODS = {
     "E2": ImprovedEulerLie,
     "SSPRKMK3": SSPRKMK3,
     "RKMK4": RKMK4,
+    "M4": Magnus4,
+    "M6": Magnus6,
+    "IE1": ImplicitEulerLie,
+    "SDIRKMK2": SDIRKMK2,
+    "SDIRKMK3": SDIRKMK3,
 }
 
 
+def _default_methods(f):
+    """Keys of the methods applicable to f. The Magnus integrators
+    only apply if f is marked as state independent."""
+    return [
+        key
+        for key, method in _METHODS.items()
+        if not issubclass(method, MagnusIntegrator)
+        or getattr(f, "state_independent", False)
+    ]
+
+
 class Flow:
     """Object which holds the calculated numerical approximation of an ODE.
     The attributes may be accessed by the regular dot syntax, or by
@@ -36,15 +63,18 @@ class Flow:
     Y : array
         Two-dimensional array containing numerical solution.
         Column Y[:, i] corresponds to the solution at T[i].
+    exp_cache_info : CacheInfo or None
+        Hits and misses of the exponential cache, if it was enabled.
     """
 
-    def __init__(self, Y, T):
+    def __init__(self, Y, T, exp_cache_info=None):
         if not isinstance(Y, np.ndarray):
             raise TypeError("Y must be a numpy array")
         if not isinstance(T, Iterable):
             raise TypeError("T must be array-like")
         self.Y = Y
         self.T = T
+        self.exp_cache_info = exp_cache_info
 
     def __iter__(self):
         yield from (self.Y.transpose(), self.T)
@@ -61,6 +91,9 @@ def solve(
     h,
     manifold: str,
     method: str,
+    exp_cache_size: int = None,
+    reducers=None,
+    chunk_size: int = 256,
 ):
     """Use the specified `method` to compute the numerical solution
     to the ODE defined by `f`. The return flow object will contain a
@@ -90,6 +123,19 @@ def solve(
     method : str
         Method to use to solve the ODE. Use `pylie.methods()`
         to print a list of available methods.
+    exp_cache_size : int, optional
+        If given, memoize up to this many evaluations of the exponential
+        map. Useful when f is autonomous and linear, where the same
+        exponentials are computed in every step. The hits and misses are
+        reported on the returned Flow object, and are not available when
+        `reducers` is given.
+    reducers : Iterable of Reducer, optional
+        If given, the solution is not stored. Instead every reducer is
+        updated with chunks of the solution as it is computed, and the
+        results of the reducers are returned. See `pylie.reducers`.
+    chunk_size : int
+        Number of steps in each chunk passed to the reducers.
+        Must be at least one.
 
     Returns
     -------
@@ -116,23 +162,66 @@ def solve(
 
         It also supports indexing: `flow[i, j]` is equivalent
         to `flow.Y[i, j]`.
+
+        If `reducers` is given, a tuple with the result of each reducer
+        is returned instead.
     """
     hmanifold = _MANIFOLDS[manifold](y)
+    exp_cache = None
+    if exp_cache_size is not None:
+        exp_cache = hmanifold.cache_exp(exp_cache_size)
     timestepper = _METHODS[method](hmanifold)
+    steps = _integrate(f, hmanifold, timestepper, t_start, t_end, h)
+    if reducers is not None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+        return _reduce(steps, hmanifold.y, t_start, reducers, chunk_size)
     N_steps, last_step = divmod((t_end - t_start), h)
     N_steps = int(N_steps)
-    T = [t_start + i * h for i in range(N_steps + 1)]
+    T = [t_start]
     number_of_cols = N_steps + 1 if np.isclose(last_step, 0) else N_steps + 2
     Y = np.zeros((len(y), number_of_cols))
     Y[:, 0] = y
+    for i, (t, y_i) in enumerate(steps, start=1):
+        Y[:, i] = y_i
+        T.append(t)
+    exp_cache_info = exp_cache.cache_info() if exp_cache is not None else None
+    return Flow(Y, T, exp_cache_info)
+
+
+def _integrate(f, hmanifold, timestepper, t_start, t_end, h):
+    """Step from t_start to t_end, yielding t and y after every step."""
+    N_steps, last_step = divmod((t_end - t_start), h)
+    N_steps = int(N_steps)
     for i in range(1, N_steps + 1):
         # The y attribute of hmanifold is used to check against constraints
         # on elements of the given manifold
         # If anything fails here, it will raise an error
-        hmanifold.y = timestepper.step(f, T[i - 1], hmanifold.y, h)
-        Y[:, i] = hmanifold.y
+        hmanifold.y = timestepper.step(f, t_start + (i - 1) * h, hmanifold.y, h)
+        yield t_start + i * h, hmanifold.y
     if not np.isclose(last_step, 0):
-        hmanifold.y = timestepper.step(f, T[-1], hmanifold.y, last_step)
-        Y[:, -1] = hmanifold.y
-        T.append(t_end)
-    return Flow(Y, T)
+        hmanifold.y = timestepper.step(
+            f, t_start + N_steps * h, hmanifold.y, last_step
+        )
+        yield t_end, hmanifold.y
+
+
+def _reduce(steps, y, t_start, reducers, chunk_size):
+    """Feed the solution to the reducers in chunks of chunk_size columns,
+    without storing the full trajectory."""
+    T = np.zeros(chunk_size)
+    Y = np.zeros((len(y), chunk_size))
+    T[0] = t_start
+    Y[:, 0] = y
+    m = 1
+    for t, y_i in steps:
+        if m == chunk_size:
+            for reducer in reducers:
+                reducer.update(T, Y)
+            m = 0
+        T[m] = t
+        Y[:, m] = y_i
+        m += 1
+    for reducer in reducers:
+        reducer.update(T[:m], Y[:, :m])
+    return tuple(reducer.result() for reducer in reducers)
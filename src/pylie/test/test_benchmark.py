@@ -0,0 +1,37 @@
+from ..benchmark import work_precision
+from ..tune import tune
+from ..solve import solve
+from .test_so3 import A
+import numpy as np
+import unittest
+
+
+class TestWorkPrecision(unittest.TestCase):
+    def test_orders_and_evaluations(self):
+        methods = ["E1", "E2", "SSPRKMK3", "RKMK4"]
+        step_lengths = [0.2, 0.1, 0.05]
+        result = work_precision(
+            A, [0.0, 0.0, 1.0], 0, 2, "hmnsphere", step_lengths, methods
+        )
+        for expected_order, method in enumerate(methods, start=1):
+            self.assertAlmostEqual(result.order[method], expected_order, delta=0.2)
+            for h, f_evals in zip(result.h, result.f_evals[method]):
+                self.assertEqual(f_evals, expected_order * round(2 / h))
+            self.assertEqual(len(result.time[method]), len(step_lengths))
+
+    def test_failing_implicit_methods(self):
+        # Over this horizon the Newton iteration of the implicit methods
+        # does not converge at the coarsest step lengths
+        y0 = [0.0, 0.0, 1.0]
+        with np.errstate(all="ignore"):
+            result = work_precision(A, y0, 0, 20, "hmnsphere", [0.5, 0.25, 0.125])
+            self.assertTrue(np.isnan(result.error["SDIRKMK3"][0]))
+            self.assertTrue(np.all(np.isfinite(result.error["RKMK4"])))
+            method, h = tune(A, y0, 0, 20, "hmnsphere", 1e-4)
+        reference = solve(A, y0, 0, 20, h / 10, "hmnsphere", "RKMK4")
+        solution = solve(A, y0, 0, 20, h, "hmnsphere", method)
+        self.assertLess(np.linalg.norm(solution[:, -1] - reference[:, -1]), 1e-4)
+
+
+if __name__ == "__main__":
+    unittest.main()
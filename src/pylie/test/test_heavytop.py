@@ -1,6 +1,7 @@
 from ..solve import solve
 from ..liealgebra import seLieAlgebra
 from ..liegroup import SELieGroup
+from ..hmanifold import HeavyTop
 import numpy as np
 import unittest
 
@@ -57,6 +58,14 @@ class TestHeavyTop(unittest.TestCase):
         actual = se3.dexpinv(u, v)
         np.testing.assert_array_almost_equal(actual, expected)
 
+    def test_dist(self):
+        heavy_top = HeavyTop()
+        a = np.array([1.0, 0.0, 0.0, 1.0, 0.2, 3.0])
+        b = np.array([1.0, 3.0, 4.0, 1.0, 0.2, 3.0])
+        self.assertEqual(heavy_top.dist(a, a), 0.0)
+        self.assertAlmostEqual(heavy_top.dist(a, b), 5.0)
+        self.assertAlmostEqual(heavy_top.dist(a, b), heavy_top.dist(b, a))
+
 
 if __name__ == "__main__":
     unittest.main()
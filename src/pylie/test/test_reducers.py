@@ -0,0 +1,54 @@
+from ..solve import solve
+from ..reducers import Minimum, Maximum, TimeAverage, Final
+from .test_heavytop import spinning_top
+import numpy as np
+import unittest
+
+
+def beta_norm(Y):
+    return np.linalg.norm(Y[3:], axis=0)
+
+
+class TestReducers(unittest.TestCase):
+    def setUp(self):
+        self.args = (
+            spinning_top,
+            np.array([np.sin(1.1), 0, np.cos(1.1), 1, 0.2, 3]),
+            0,
+            2,
+            0.03,
+            "heavytop",
+            "RKMK4",
+        )
+        self.flow = solve(*self.args)
+
+    def test_matches_flow(self):
+        Y, T = self.flow.Y, self.flow.T
+        # A small chunk size makes the reducers span several chunks
+        minimum, maximum, average, final, casimir = solve(
+            *self.args,
+            reducers=[
+                Minimum(),
+                Maximum(),
+                TimeAverage(),
+                Final(),
+                Maximum(beta_norm),
+            ],
+            chunk_size=7,
+        )
+        np.testing.assert_array_almost_equal(minimum, Y.min(axis=1))
+        np.testing.assert_array_almost_equal(maximum, Y.max(axis=1))
+        expected_average = np.sum(
+            0.5 * np.diff(T) * (Y[:, 1:] + Y[:, :-1]), axis=1
+        ) / (T[-1] - T[0])
+        np.testing.assert_array_almost_equal(average, expected_average)
+        np.testing.assert_array_equal(final, Y[:, -1])
+        self.assertAlmostEqual(casimir, np.linalg.norm(self.args[1][3:]))
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            solve(*self.args, reducers=[Final()], chunk_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
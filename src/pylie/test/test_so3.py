@@ -1,6 +1,9 @@
 from ..solve import solve
+from ..timestepper import state_independent
 from ..liegroup import SOLieGroup
 from ..liealgebra import soLieAlgebra
+from ..hmanifold import ExpCache, HomogenousSphere
+from ..timestepper import SDIRKMK2
 import numpy as np
 import unittest
 
@@ -11,6 +14,9 @@ def A(t, y):
     )
 
 
+A_linear = state_independent(A)
+
+
 class Testso3(unittest.TestCase):
     def test_matrix_representation(self):
         # Matrix-multiplication should be equal to the cross product
@@ -32,6 +38,89 @@ class Testso3(unittest.TestCase):
         for i in range(len(solution.T)):
             self.assertAlmostEqual(np.linalg.norm(solution[:, i]), 1.0)
 
+    def test_magnus(self):
+        y0 = [0.0, 0.0, 1.0]
+        reference = solve(A, y0, 0, 2, 0.001, "hmnsphere", "RKMK4")
+        for method in ["M4", "M6"]:
+            solution = solve(A_linear, y0, 0, 2, 0.05, "hmnsphere", method)
+            for i in range(len(solution.T)):
+                self.assertAlmostEqual(np.linalg.norm(solution[:, i]), 1.0)
+            np.testing.assert_array_almost_equal(
+                solution[:, -1], reference[:, -1], decimal=6
+            )
+
+    def test_magnus_requires_state_independent(self):
+        with self.assertRaises(ValueError):
+            solve(A, [0.0, 0.0, 1.0], 0, 1, 0.1, "hmnsphere", "M4")
+
+    def test_state_independent_wraps(self):
+        class Generator:
+            def generator(self, t, y):
+                return A(t, y)
+
+        # Bound methods do not accept new attributes
+        marked = state_independent(Generator().generator)
+        self.assertTrue(marked.state_independent)
+        self.assertFalse(hasattr(A, "state_independent"))
+        solution = solve(marked, [0.0, 0.0, 1.0], 0, 1, 0.1, "hmnsphere", "M4")
+        self.assertAlmostEqual(np.linalg.norm(solution[:, -1]), 1.0)
+
+    def test_exp_cache(self):
+        def B(t, y):
+            return np.array([[0, 1, 0.2], [-1, 0, 0.3], [-0.2, -0.3, 0]])
+
+        y0 = [0.0, 0.0, 1.0]
+        expected = solve(B, y0, 0, 1, 0.1, "hmnsphere", "RKMK4")
+        actual = solve(B, y0, 0, 1, 0.1, "hmnsphere", "RKMK4", exp_cache_size=8)
+        np.testing.assert_array_equal(actual.Y, expected.Y)
+        self.assertIsNone(expected.exp_cache_info)
+        self.assertGreater(actual.exp_cache_info.hits, 0)
+        self.assertLessEqual(actual.exp_cache_info.currsize, 8)
+
+    def test_exp_cache_eviction(self):
+        so3 = soLieAlgebra(SOLieGroup())
+        cache = ExpCache(so3.exp, maxsize=2)
+        x, y, z = np.eye(3)
+        cache(x)
+        cache(y)
+        cache(x)
+        cache(z)  # evicts y, the least recently used
+        cache(x)
+        cache(y)
+        self.assertEqual(cache.cache_info(), (2, 4, 2, 2))
+
+    def test_implicit_stiff(self):
+        # Gradient flow towards e_x, stiff with rate 1000
+        so3 = soLieAlgebra(SOLieGroup())
+
+        def B(t, y):
+            return so3.matrix(1000 * np.cross(y, [1, 0, 0]) + [0, 0, 1])
+
+        y0 = np.array([0.0, 0.6, 0.8])
+        reference = solve(B, y0, 0, 1, 1e-4, "hmnsphere", "RKMK4")
+        for method in ["IE1", "SDIRKMK2", "SDIRKMK3"]:
+            solution = solve(B, y0, 0, 1, 0.1, "hmnsphere", method)
+            np.testing.assert_array_almost_equal(
+                solution[:, -1], reference[:, -1], decimal=8
+            )
+
+    def test_implicit_jacobian_reuse(self):
+        y = np.array([0.0, 0.0, 1.0])
+        timestepper = SDIRKMK2(HomogenousSphere(y))
+        for i in range(50):
+            y = timestepper.step(A, i * 0.01, y, 0.01)
+        self.assertAlmostEqual(np.linalg.norm(y), 1.0)
+        # 100 stages are solved, the Jacobian is only updated occasionally
+        self.assertLess(timestepper.jacobian_evaluations, 10)
+
+    def test_sphere_dist(self):
+        sphere = HomogenousSphere()
+        a = np.array([1.0, 0.0, 0.0])
+        b = np.array([0.0, 1.0, 0.0])
+        self.assertAlmostEqual(sphere.dist(a, b), np.pi / 2)
+        self.assertAlmostEqual(sphere.dist(a, -a), np.pi)
+        self.assertEqual(sphere.dist(a, a), 0.0)
+
 
 if __name__ == "__main__":
     unittest.main()
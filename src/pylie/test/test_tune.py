@@ -0,0 +1,44 @@
+from ..tune import tune
+from ..solve import solve
+from .test_heavytop import spinning_top
+from .test_so3 import A
+import numpy as np
+import unittest
+
+
+class TestTune(unittest.TestCase):
+    def test_meets_tolerance(self):
+        y0 = np.array([np.sin(1.1), 0, np.cos(1.1), 1, 0.2, 3])
+        reference = solve(spinning_top, y0, 0, 5, 0.001, "heavytop", "RKMK4")
+        for tol in [1e-3, 1e-6]:
+            method, h = tune(spinning_top, y0, 0, 5, "heavytop", tol)
+            solution = solve(spinning_top, y0, 0, 5, h, "heavytop", method)
+            error = np.linalg.norm(solution[:, -1] - reference[:, -1])
+            self.assertLess(error, tol)
+
+    def test_skips_magnus_for_state_dependent_f(self):
+        method, _ = tune(A, [0.0, 0.0, 1.0], 0, 1, "hmnsphere", 1e-8)
+        self.assertNotIn(method, ["M4", "M6"])
+
+    def test_diverged_pilot_is_skipped(self):
+        # Small principal moments make the rotation per pilot step pass the
+        # singularity of dexpinv, and the RKMK4 pilots return NaN
+        def fast_top(t, y):
+            return spinning_top(t, y, principal_moments=np.array([2e-3, 2e-3, 1e-3]))
+
+        y0 = np.array([np.sin(1.1), 0, np.cos(1.1), 1, 0.2, 3])
+        with np.errstate(all="ignore"):
+            method, _ = tune(fast_top, y0, 0, 1, "heavytop", 1e-6, ["E1", "RKMK4"])
+            self.assertEqual(method, "E1")
+            with self.assertRaises(RuntimeError):
+                tune(fast_top, y0, 0, 1, "heavytop", 1e-6, ["RKMK4"])
+
+    def test_failed_pilot_is_skipped(self):
+        # The Magnus integrators raise for generators not marked as
+        # state independent
+        method, _ = tune(A, [0.0, 0.0, 1.0], 0, 1, "hmnsphere", 1e-4, ["M4", "E2"])
+        self.assertEqual(method, "E2")
+
+
+if __name__ == "__main__":
+    unittest.main()
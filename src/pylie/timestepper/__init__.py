@@ -1,3 +1,29 @@
-from .timestepper import EulerLie, ImprovedEulerLie, SSPRKMK3, RKMK4
+from .timestepper import (
+    EulerLie,
+    ImprovedEulerLie,
+    SSPRKMK3,
+    RKMK4,
+    MagnusIntegrator,
+    Magnus4,
+    Magnus6,
+    DIRKTimeStepper,
+    ImplicitEulerLie,
+    SDIRKMK2,
+    SDIRKMK3,
+    state_independent,
+)
 
-__all__ = ["EulerLie", "ImprovedEulerLie", "SSPRKMK3", "RKMK4"]
+__all__ = [
+    "EulerLie",
+    "ImprovedEulerLie",
+    "SSPRKMK3",
+    "RKMK4",
+    "MagnusIntegrator",
+    "Magnus4",
+    "Magnus6",
+    "DIRKTimeStepper",
+    "ImplicitEulerLie",
+    "SDIRKMK2",
+    "SDIRKMK3",
+    "state_independent",
+]
@@ -1,4 +1,6 @@
+import functools
 import numpy as np
+from scipy.linalg import lu_factor, lu_solve
 
 
 class TimeStepper:
@@ -76,3 +78,213 @@ class RKMK4(TimeStepper):
         self.c = np.array([0, 0.5, 0.5, 1.0])
         self.order = 4
         self.s = 4
+
+
+def state_independent(f):
+    """Mark the generator `f` as independent of the state y, i.e. the
+    ODE is linear: dy/dt = f(t) · y. Required by the Magnus integrators.
+
+    Returns a wrapper carrying the mark, `f` itself is not modified."""
+
+    @functools.wraps(f)
+    def wrapper(t, y):
+        return f(t, y)
+
+    wrapper.state_independent = True
+    return wrapper
+
+
+class MagnusIntegrator(TimeStepper):
+    """Base class for Magnus integrators of linear ODEs dy/dt = f(t) · y.
+
+    The generator is sampled in the Gauss-Legendre nodes `c`, and the
+    truncated Magnus expansion is computed by `omega`. No dexpinv is needed.
+    """
+
+    def __init__(self, manifold):
+        super().__init__(manifold)
+        self.commutator = manifold.commutator
+        self.vector = manifold.vector
+
+    def step(self, f, t, y, h):
+        if not getattr(f, "state_independent", False):
+            raise ValueError(
+                "Magnus integrators require a state independent generator. "
+                "Mark f with pylie.state_independent"
+            )
+        A = [self.vector(f(t + c * h, y)) for c in self.c]
+        return self.action(self.exp(self.omega(A, h)), y)
+
+    def omega(self, A, h):
+        raise NotImplementedError
+
+
+class Magnus4(MagnusIntegrator):
+    def __init__(self, manifold):
+        super().__init__(manifold)
+        self.c = np.array([0.5 - np.sqrt(3) / 6, 0.5 + np.sqrt(3) / 6])
+        self.order = 4
+        self.s = 2
+
+    def omega(self, A, h):
+        A1, A2 = A
+        return 0.5 * h * (A1 + A2) + (np.sqrt(3) * h ** 2 / 12) * self.commutator(
+            A2, A1
+        )
+
+
+class Magnus6(MagnusIntegrator):
+    def __init__(self, manifold):
+        super().__init__(manifold)
+        self.c = np.array([0.5 - np.sqrt(15) / 10, 0.5, 0.5 + np.sqrt(15) / 10])
+        self.order = 6
+        self.s = 3
+
+    def omega(self, A, h):
+        A1, A2, A3 = A
+        Q1 = h * A2
+        Q2 = (np.sqrt(15) * h / 3) * (A3 - A1)
+        Q3 = (10 * h / 3) * (A3 - 2 * A2 + A1)
+        R1 = self.commutator(Q1, Q2)
+        R2 = self.commutator(Q1, 2 * Q3 + R1)
+        return (
+            Q1
+            + Q3 / 12
+            + self.commutator(-20 * Q1 - Q3 + R1, Q2 - R2 / 60) / 240
+        )
+
+
+class DIRKTimeStepper(TimeStepper):
+    """Base class for diagonally implicit RKMK methods.
+
+    Each stage equation k_i = dexpinv(u_i, f(t + c_i h, exp(u_i) · y)), with
+    u_i = h (a_i1 k_1 + ... + a_ii k_i), is solved in the Lie algebra by a
+    simplified Newton iteration. The Jacobian is approximated by finite
+    differences and its LU factorization is reused across stages and steps,
+    as long as h · a_ii is unchanged and the iteration converges.
+    """
+
+    def __init__(
+        self, manifold, tol=1e-10, maxiter=10, max_refreshes=3, max_update=1.0
+    ):
+        super().__init__(manifold)
+        self.tol = tol
+        self.maxiter = maxiter
+        self.max_refreshes = max_refreshes
+        self.max_update = max_update
+        self.jacobian_evaluations = 0
+        self._lu = None
+        self._lu_ha = None
+
+    def step(self, f, t, y, h):
+        n = y.size
+        k = np.zeros((n, self.s))
+        for i in range(self.s):
+            w = np.zeros(n)
+            for j in range(i):
+                w += self.a[i, j] * k[:, j]
+            w *= h
+            k[:, i] = self._solve_stage(f, t + self.c[i] * h, y, w, h * self.a[i, i])
+        v = np.zeros(n)
+        for i in range(self.s):
+            v += self.b[i] * k[:, i]
+        return self.action(self.exp(h * v), y)
+
+    def _solve_stage(self, f, t, y, w, ha):
+        def F(u):
+            return self.dexpinv(u, f(t, self.action(self.exp(u), y)), self.order)
+
+        if ha == 0:
+            return F(w)
+        # The explicit predictor F(w) overshoots badly for stiff problems,
+        # so the iteration is started from zero
+        k = np.zeros(w.size)
+        if self._lu is None or self._lu_ha != ha:
+            self._factorize(F, w, ha)
+        for _ in range(self.max_refreshes + 1):
+            converged, k = self._newton(F, w, ha, k)
+            if converged:
+                return k
+            # The Jacobian is stale, recompute it at the latest iterate
+            if not np.all(np.isfinite(k)):
+                k = np.zeros(w.size)
+            self._factorize(F, w + ha * k, ha)
+        raise RuntimeError(
+            f"Newton iteration did not converge after {self.max_refreshes} "
+            "Jacobian updates. Try a shorter step length"
+        )
+
+    def _newton(self, F, w, ha, k):
+        previous = np.inf
+        for _ in range(self.maxiter):
+            delta = lu_solve(self._lu, F(w + ha * k) - k)
+            size = np.linalg.norm(delta)
+            if ha * size > self.max_update:
+                # Damp the update, far from the solution the linear model can
+                # overshoot into a different branch of the logarithm
+                delta *= self.max_update / (ha * size)
+                size = np.linalg.norm(delta)
+            k = k + delta
+            if size <= self.tol * (1 + np.linalg.norm(k)):
+                return True, k
+            if size >= previous:
+                # Diverging or stagnating
+                return False, k
+            previous = size
+        return False, k
+
+    def _factorize(self, F, u, ha):
+        n = u.size
+        F_u = F(u)
+        J = np.zeros((n, n))
+        for j in range(n):
+            du = np.sqrt(np.finfo(float).eps) * max(1.0, abs(u[j]))
+            u_perturbed = u.copy()
+            u_perturbed[j] += du
+            J[:, j] = (F(u_perturbed) - F_u) / du
+        self._lu = lu_factor(np.eye(n) - ha * J)
+        self._lu_ha = ha
+        self.jacobian_evaluations += 1
+
+
+class ImplicitEulerLie(DIRKTimeStepper):
+    def __init__(self, manifold, *args, **kwargs):
+        super().__init__(manifold, *args, **kwargs)
+        self.a = np.array([[1.0]])
+        self.b = np.array([1.0])
+        self.c = np.array([1.0])
+        self.order = 1
+        self.s = 1
+
+
+class SDIRKMK2(DIRKTimeStepper):
+    def __init__(self, manifold, *args, **kwargs):
+        super().__init__(manifold, *args, **kwargs)
+        gamma = 1 - 1 / np.sqrt(2)
+        self.a = np.array([[gamma, 0], [1 - gamma, gamma]])
+        self.b = np.array([1 - gamma, gamma])
+        self.c = np.array([gamma, 1.0])
+        self.order = 2
+        self.s = 2
+
+
+class SDIRKMK3(DIRKTimeStepper):
+    def __init__(self, manifold, *args, **kwargs):
+        super().__init__(manifold, *args, **kwargs)
+        # Alexander's L-stable method
+        gamma = 0.435866521508458999416019
+        b1 = -(6 * gamma ** 2 - 16 * gamma + 1) / 4
+        b2 = (6 * gamma ** 2 - 20 * gamma + 5) / 4
+        # fmt: off
+        self.a = np.array(
+            [
+                [gamma,             0,     0],
+                [(1 - gamma) / 2,   gamma, 0],
+                [b1,                b2,    gamma]
+            ]
+        )
+        # fmt: on
+        self.b = np.array([b1, b2, gamma])
+        self.c = np.array([gamma, (1 + gamma) / 2, 1.0])
+        self.order = 3
+        self.s = 3
@@ -0,0 +1,3 @@
+from .tune import tune
+
+__all__ = ["tune"]
@@ -0,0 +1,123 @@
+import time
+import numpy as np
+from collections.abc import Iterable
+from typing import Callable
+
+from ..solve import solve, _MANIFOLDS, _METHODS, _default_methods
+
+
+def tune(
+    f: Callable[[float, Iterable], Iterable],
+    y,
+    t_start,
+    t_end,
+    manifold: str,
+    tol,
+    methods=None,
+    pilot_steps=20,
+    safety=0.9,
+):
+    """Find the cheapest combination of method and step length which
+    solves the ODE defined by `f` on [t_start, t_end] with a global
+    error below `tol`.
+
+    Every method is run over the whole interval with a few coarse steps of
+    length h, and with step length h/2. Richardson extrapolation of the
+    distance between the two results on the manifold estimates the global
+    error C · h^p at t_end. From this the largest step length meeting the
+    tolerance is predicted, and its cost is estimated from the measured
+    wall time per step of the pilot runs.
+
+    Parameters
+    ----------
+    f : Callable[[float, Iterable], Iterable]
+        Function defining the differential equation.
+        Must have call signature `f(t, y)`.
+    y : Iterable
+        Initial value
+    t_start : number
+        Initial time
+    t_end : number
+        End time
+    manifold : str
+        Manifold on which the ODE evolves. Use `pylie.manifolds()`
+        to print a list.
+    tol : number
+        Requested global error at t_end, measured by the distance
+        function of the manifold.
+    methods : Iterable of str, optional
+        Methods to consider. Defaults to every method in `pylie.methods()`
+        applicable to `f`.
+    pilot_steps : int
+        Number of steps in the coarse pilot integration. The step length
+        returned is never longer than that of the coarse pilot.
+    safety : number
+        Factor multiplied with the predicted step length.
+
+    Methods whose pilot integrations fail or diverge are not considered.
+
+    Returns
+    -------
+    (str, number)
+        The method and step length to pass to `pylie.solve`.
+    """
+    if methods is None:
+        methods = _default_methods(f)
+    hmanifold = _MANIFOLDS[manifold](y)
+    horizon = t_end - t_start
+    h_pilot = horizon / pilot_steps
+
+    best = None
+    failed = []
+    failure = None
+    for method in methods:
+        order = _METHODS[method](hmanifold).order
+        runs = []
+        elapsed = 0.0
+        try:
+            for h in (h_pilot, h_pilot / 2):
+                start = time.perf_counter()
+                runs.append(solve(f, y, t_start, t_end, h, manifold, method))
+                elapsed += time.perf_counter() - start
+        except Exception as e:
+            # The pilot failed, e.g. it left the manifold or the
+            # Newton iteration of an implicit method did not converge
+            failed.append(method)
+            failure = e
+            continue
+        coarse, fine = runs
+        cost_per_step = elapsed / (len(coarse.T) + len(fine.T) - 2)
+
+        # Richardson extrapolation: the error of the coarse solution is
+        # approximately 2^p / (2^p - 1) times its distance to the fine one
+        error = (
+            hmanifold.dist(coarse.Y[:, -1], fine.Y[:, -1])
+            * 2 ** order
+            / (2 ** order - 1)
+        )
+        if not np.isfinite(error):
+            # The pilot diverged
+            failed.append(method)
+            continue
+        if error > 0:
+            h = min(safety * h_pilot * (tol / error) ** (1 / order), h_pilot)
+            if h == 0:
+                failed.append(method)
+                continue
+        else:
+            h = h_pilot
+        # Round h down so that it divides the horizon
+        N_steps = int(np.ceil(horizon / h))
+        h = horizon / N_steps
+        cost = N_steps * cost_per_step
+        if best is None or cost < best[0]:
+            best = (cost, method, h)
+
+    if best is None:
+        if failed:
+            raise RuntimeError(
+                f"The pilot integrations failed or diverged for {failed}"
+            ) from failure
+        raise ValueError("No methods to choose from")
+    _, method, h = best
+    return method, h